@@ -6,16 +6,31 @@ Flow: Price Filter → Title Filter → Green Light → Scrape Description → Q
 
 import asyncio
 import json
+import hashlib
 import logging
 import os
+import random
 import re
 import sqlite3
-from datetime import datetime
+import sys
+import time
+import types
+import queue
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import formatdate
 from typing import Dict, List, Optional, Tuple
 
 import httpx
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+import jinja2
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi.staticfiles import StaticFiles
+import soupsieve
 from bs4 import BeautifulSoup
 import uvicorn
 
@@ -34,6 +49,35 @@ except ImportError:
             logger.warning("⚠️ Mock mode - no real scraping")
             return []
 
+try:
+    import aiohttp
+    from httpx_aiohttp import AiohttpTransport
+    AIOHTTP_TRANSPORT_AVAILABLE = True
+except ImportError:
+    AIOHTTP_TRANSPORT_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# C-based HTML parser, roughly an order of magnitude faster than
+# BeautifulSoup+html.parser on listing pages; bs4 remains the fallback
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# libuv-based event loop; ships with uvicorn[standard] on Linux
+try:
+    import uvloop
+    uvloop.install()
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Enhanced logging configuration
 logging.basicConfig(
     level=logging.INFO,
@@ -42,7 +86,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="DJI Drones Bot")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the bot on boot, release shared resources on shutdown"""
+    await _startup()
+    tasks = [
+        asyncio.create_task(scheduler()),
+        asyncio.create_task(discord_worker()),
+    ]
+    yield
+    # Cancel background work first so nothing touches the client or writer
+    # connection while they're being closed
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if HTTP_CLIENT is not None:
+        await HTTP_CLIENT.aclose()
+    if WRITER_CONN is not None:
+        WRITER_CONN.close()
+
+app = FastAPI(title="DJI Drones Bot", default_response_class=ORJSONResponse,
+              lifespan=lifespan)
+# Dashboard HTML is repetitive (inline CSS + 20 deal cards) and gzips ~5x
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+class _CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep the stylesheet for a day"""
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers['Cache-Control'] = 'public, max-age=86400'
+        return response
+
+# Dashboard CSS lives in static/ so 60s auto-refreshes re-download only the
+# small dynamic HTML; the ?v= query in the template busts the cache on edits
+app.mount("/static",
+          _CachedStaticFiles(directory=os.path.join(os.path.dirname(__file__), "static")),
+          name="static")
 DATABASE_FILE = "dji_drones_bot.db"
 
 # Configuration
@@ -58,8 +137,12 @@ SESSION_RESET_DELAY = 60
 SCRAPE_DELAY = 2  # Faster scraping
 MIN_SELLER_REVIEWS = 1  # Require at least 1 review (filter out 0 reviews)
 
+# Derived once from the knobs above instead of being recomputed in log calls
+CYCLE_MINUTES = CYCLE_INTERVAL // 60
+MAX_ITEMS_PER_PRODUCT = format(MAX_PAGES_PER_SEARCH * ITEMS_PER_PAGE, ',')
+
 # CRITICAL EXCLUSIONS - Always filter these (for TITLE filtering)
-CRITICAL_EXCLUSIONS_TITLE = [
+CRITICAL_EXCLUSIONS_TITLE = (
     'broken', 'damaged', 'faulty', 'not working', 'for parts', 'spares', 'repair',
     'cracked', 'water damage', 'dead', 'replica', 'fake', 'poor condition',
     'smashed',
@@ -106,10 +189,10 @@ CRITICAL_EXCLUSIONS_TITLE = [
     'massage', 'massage gun', 'wellness',
     # Airsoft/gaming accessories
     'tracer unit', 'airsoft', 'ksg',
-]
+)
 
 # DESCRIPTION EXCLUSIONS - Check after scraping description
-CRITICAL_EXCLUSIONS_DESC = [
+CRITICAL_EXCLUSIONS_DESC = (
     'broken', 'damaged', 'faulty', 'not working', 'doesn\'t work', 'does not work',
     'for parts', 'spares', 'repair needed', 'needs repair', 'needs fixing',
     'cracked', 'crack', 'scratched badly', 'heavily scratched', 'major scratches',
@@ -121,7 +204,45 @@ CRITICAL_EXCLUSIONS_DESC = [
     'locked', 'password protected', 'can\'t access', 'cannot access',
     'stolen', 'lost property', 'found',
     'fly away', 'flyaway', 'lost drone', 'crashed',
-]
+)
+
+# Normalize the hand-maintained lists once at import: lowercase and drop
+# duplicates (dict.fromkeys keeps declaration order), so the automatons and
+# merged regexes below never carry redundant terms
+CRITICAL_EXCLUSIONS_TITLE = tuple(dict.fromkeys(t.lower() for t in CRITICAL_EXCLUSIONS_TITLE))
+CRITICAL_EXCLUSIONS_DESC = tuple(dict.fromkeys(t.lower() for t in CRITICAL_EXCLUSIONS_DESC))
+
+# Tokenizer for word-level matching - compiled once, reused per title
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+def _build_automaton(terms):
+    """Build an Aho-Corasick automaton matching any of the given terms"""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+# One automaton per exclusion list: a single linear pass over the text finds
+# any of the ~100 terms, instead of one substring scan per term
+if AHOCORASICK_AVAILABLE:
+    TITLE_EXCLUSION_AUTOMATON = _build_automaton(CRITICAL_EXCLUSIONS_TITLE)
+    DESC_EXCLUSION_AUTOMATON = _build_automaton(CRITICAL_EXCLUSIONS_DESC)
+else:
+    TITLE_EXCLUSION_AUTOMATON = None
+    DESC_EXCLUSION_AUTOMATON = None
+
+# Regex fallback when pyahocorasick is absent: one compiled alternation
+# gives a single C-level scan instead of a Python loop of substring checks.
+# Longest-first ordering makes the alternation prefer 'case only' over
+# 'case' at the same position, so the reported term is the most specific.
+def _exclusion_regex(terms) -> re.Pattern:
+    return re.compile('|'.join(
+        re.escape(t) for t in sorted(terms, key=len, reverse=True)
+    ))
+
+TITLE_EXCLUSION_RE = _exclusion_regex(CRITICAL_EXCLUSIONS_TITLE)
+DESC_EXCLUSION_RE = _exclusion_regex(CRITICAL_EXCLUSIONS_DESC)
 
 # Product specifications with buy prices - ONLY DJI MINI 2 MODELS
 PRODUCT_SPECS = {
@@ -136,11 +257,273 @@ PRODUCT_SPECS = {
     },
 }
 
-DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL", "https://discordapp.com/api/webhooks/1422243737261707382/aoFqRx4rpIaplAGL96W8r19iCLrucHCt7gbdmK2hLzXP9q9QZO3pGJAi9OBqW1Ghunaz")
+# Freeze the spec table: tuples for term lists and a read-only mapping with
+# interned keys, so hot-path name comparisons are pointer equality
+for _spec in PRODUCT_SPECS.values():
+    _spec['search_terms'] = tuple(_spec['search_terms'])
+PRODUCT_SPECS = types.MappingProxyType({sys.intern(k): v for k, v in PRODUCT_SPECS.items()})
+
+# Per-spec keyword requirements resolved once at import, so the title
+# matcher never re-tokenizes the product name per listing
+SPEC_REQUIRES_SE = {
+    name: 'se' in TOKEN_RE.findall(name) for name in PRODUCT_SPECS
+}
+
+# Price bounds per product, derived once at import (search from £1 to max buy)
+PRICE_BOUNDS = {name: (1.0, spec['max_buy']) for name, spec in PRODUCT_SPECS.items()}
+
+# Primary search term per product, resolved once at import instead of
+# re-reading the spec dict on every seeding/scan pass
+PRIMARY_SEARCH_TERMS = {name: spec['search_terms'][0] for name, spec in PRODUCT_SPECS.items()}
+
+def _compile_spec_matcher(product_name: str):
+    """Generate a specialized title matcher for one spec.
+
+    The spec table is fixed at import, so the requirement checks are emitted
+    as literal membership tests and compiled once - the hot path then runs
+    plain bytecode with no dict lookups or spec interpretation.
+    """
+    func_name = 'match_' + re.sub(r'\W+', '_', product_name)
+    lines = [
+        f"def {func_name}(tokens):",
+        "    if 'dji' not in tokens:",
+        "        return False",
+        "    if 'mini' not in tokens and 'mini2' not in tokens:",
+        "        return False",
+    ]
+    if SPEC_REQUIRES_SE[product_name]:
+        lines += [
+            "    if 'se' not in tokens:",
+            "        return False",
+        ]
+    lines.append("    return True")
+    namespace = {}
+    exec(compile('\n'.join(lines), f'<spec matcher: {product_name}>', 'exec'), namespace)
+    return namespace[func_name]
+
+SPEC_MATCHERS = {name: _compile_spec_matcher(name) for name in PRODUCT_SPECS}
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Allows short bursts up to `burst` requests while keeping the long-run
+    rate at `rate` per second, so concurrent coroutines can overlap instead
+    of serializing behind fixed sleeps.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+# Page fetches average one per PAGE_DELAY seconds but may burst
+PAGE_LIMITER = TokenBucket(rate=1.0 / PAGE_DELAY, burst=2)
+
+# Product scans start at most one per PRODUCT_DELAY seconds on average —
+# the token-bucket replacement for the old fixed inter-product sleep
+PRODUCT_PACER = TokenBucket(rate=1.0 / PRODUCT_DELAY, burst=1)
+
+# Bound on concurrently in-flight page fetches and the wave size used when
+# paginating a search
+PAGE_SEMAPHORE = asyncio.Semaphore(8)
+PAGE_BATCH_SIZE = 8
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD bound on in-flight requests.
+
+    Works like a semaphore whose size adapts to how the site responds:
+    a streak of clean responses grows the cap by one, a throttle response
+    (403/406/429) halves it. Keeps scrapes fast when Vinted is permissive
+    and backs off quickly when it pushes back.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 8,
+                 grow_after: int = 10):
+        self._limit = initial
+        self._min = minimum
+        self._max = maximum
+        self._grow_after = grow_after
+        self._successes = 0
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def __aenter__(self):
+        async with self._cond:
+            while self._active >= self._limit:
+                await self._cond.wait()
+            self._active += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    async def record_success(self):
+        async with self._cond:
+            self._successes += 1
+            if self._successes >= self._grow_after and self._limit < self._max:
+                self._limit += 1
+                self._successes = 0
+                self._cond.notify_all()
+
+    async def record_throttle(self):
+        async with self._cond:
+            self._successes = 0
+            halved = max(self._min, self._limit // 2)
+            if halved != self._limit:
+                self._limit = halved
+                logger.warning("⚠️  Throttled — scrape concurrency halved to %s", halved)
+
+# Adaptive bound on concurrent listing-detail scrapes
+SCRAPE_LIMITER = AdaptiveConcurrencyLimiter(initial=4)
+
+# Paces detail scrapes at the old SCRAPE_DELAY average rate, but as a token
+# bucket: a small burst drains instantly and sustained load smooths out,
+# instead of every item paying the fixed sleep
+SCRAPE_PACER = TokenBucket(rate=1.0 / SCRAPE_DELAY, burst=4)
+
+# HTTP statuses Vinted uses to push back on scraping
+THROTTLE_STATUSES = frozenset({403, 406, 429})
+
+# Bound on concurrent Discord webhook posts (webhooks allow ~30 req/min)
+DISCORD_SEMAPHORE = asyncio.Semaphore(5)
+
+# Bound on products scanned concurrently within one cycle
+PRODUCT_SEMAPHORE = asyncio.Semaphore(2)
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Shared HTTP client - connection pooling avoids a TCP+TLS handshake per request
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get (or lazily create) the shared pooled HTTP client"""
+    global HTTP_CLIENT
+    if HTTP_CLIENT is None:
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        client_kwargs = dict(
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+            follow_redirects=True,
+            limits=limits,
+            # Compressed transfer cuts page downloads several-fold
+            headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'br, gzip'}
+        )
+        if AIOHTTP_TRANSPORT_AVAILABLE:
+            # aiohttp handles many concurrent requests noticeably faster than
+            # httpx's own transport; keep the httpx API either way
+            client_kwargs['transport'] = AiohttpTransport(
+                client=aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+            )
+        else:
+            # Retry transient connection resets instead of refetching pages
+            client_kwargs['transport'] = httpx.AsyncHTTPTransport(
+                retries=2, http2=True, limits=limits
+            )
+        HTTP_CLIENT = httpx.AsyncClient(**client_kwargs)
+    return HTTP_CLIENT
+
+# Single scraper instance reused across cycles so its internal HTTP session
+# (and Vinted auth cookies) survive instead of being rebuilt every 10 minutes
+SCRAPER: Optional[AsyncVintedScraper] = None
+
+def get_scraper() -> AsyncVintedScraper:
+    """Get (or lazily create) the shared Vinted scraper"""
+    global SCRAPER
+    if SCRAPER is None:
+        SCRAPER = AsyncVintedScraper(baseurl="https://www.vinted.co.uk")
+    return SCRAPER
+
+DISCORD_WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL","https://discordapp.com/api/webhooks/1422243737261707382/aoFqRx4rpIaplAGL96W8r19iCLrucHCt7gbdmK2hLzXP9q9QZO3pGJAi9OBqW1Ghunaz")
+
+def get_conn() -> sqlite3.Connection:
+    """Open a SQLite connection with tuned pragmas (WAL, relaxed sync)"""
+    conn = sqlite3.connect(DATABASE_FILE, cached_statements=256)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=134217728;
+    """)
+    return conn
+
+# Single long-lived writer connection (scan cycle) + read-only connections
+# for HTTP handlers, so dashboard reads never queue behind the scraper's writes
+WRITER_CONN: Optional[sqlite3.Connection] = None
+WRITER_LOCK = asyncio.Lock()
+
+# Single worker thread so the writer connection stays on one thread and
+# commit fsyncs never block the event loop
+WRITER_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+def get_writer_conn() -> sqlite3.Connection:
+    """Get (or lazily create) the shared writer connection"""
+    global WRITER_CONN
+    if WRITER_CONN is None:
+        WRITER_CONN = sqlite3.connect(DATABASE_FILE, check_same_thread=False,
+                                      cached_statements=256)
+        WRITER_CONN.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=134217728;
+        """)
+    return WRITER_CONN
+
+def get_read_conn() -> sqlite3.Connection:
+    """Open a read-only connection (WAL readers don't block the writer)"""
+    conn = sqlite3.connect(f"file:{DATABASE_FILE}?mode=ro", uri=True,
+                           check_same_thread=False, cached_statements=256)
+    conn.executescript("""
+        PRAGMA busy_timeout=5000;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=134217728;
+    """)
+    return conn
+
+# Small pool of read-only connections: dashboard rebuilds borrow one instead
+# of paying connect + pragma setup per render; overflow connections just close
+_READ_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=4)
+
+@contextmanager
+def read_conn():
+    """Borrow a pooled read-only connection for the duration of a block"""
+    try:
+        conn = _READ_POOL.get_nowait()
+    except queue.Empty:
+        conn = get_read_conn()
+    try:
+        yield conn
+    finally:
+        try:
+            _READ_POOL.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 def init_database():
     """Initialize SQLite database"""
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = get_conn()
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -170,222 +553,416 @@ def init_database():
             seller_reviews INTEGER,
             passed_title_filter BOOLEAN DEFAULT FALSE,
             passed_desc_filter BOOLEAN DEFAULT FALSE,
-            notified_at TEXT NOT NULL,
+            notified_at INTEGER NOT NULL,
             FOREIGN KEY (search_query_id) REFERENCES search_queries(id)
         )
     """)
     
+    # Composite index backing the per-product/top-products lookups; the
+    # UNIQUE constraint on vinted_id already gives dedupe a single B-tree probe
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tracked_items_query_notified
+        ON tracked_items(search_query_id, notified_at)
+    """)
+
+    # Covers the enabled = TRUE filter used by the cycle and dashboard queries
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_search_queries_enabled
+        ON search_queries(enabled)
+    """)
+
+    # Seed planner statistics so fresh deploys pick the indexes above;
+    # per-cycle PRAGMA optimize keeps them current afterwards
+    cursor.execute("ANALYZE")
+
     conn.commit()
     conn.close()
     logger.info("✅ Database initialized")
 
 async def create_search_queries():
     """Create search queries from PRODUCT_SPECS"""
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = get_conn()
     cursor = conn.cursor()
-    
-    for product_name, pricing in PRODUCT_SPECS.items():
-        max_buy = pricing['max_buy']
-        
-        # Use the first search term as primary
-        search_terms = pricing.get('search_terms', [product_name])
-        primary_search_term = search_terms[0]
-        
-        # Price range: £1 to max buy price
-        price_from = 1.0
-        price_to = max_buy
-        
-        cursor.execute("""
-            INSERT OR IGNORE INTO search_queries 
-            (name, search_term, price_from, price_to, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            product_name,
-            primary_search_term,
-            price_from,
-            price_to,
-            datetime.utcnow().isoformat()
-        ))
-    
+
+    created_at = datetime.now(timezone.utc).isoformat()
+    rows = []
+    for product_name in PRODUCT_SPECS:
+        price_from, price_to = PRICE_BOUNDS[product_name]
+        rows.append((product_name, PRIMARY_SEARCH_TERMS[product_name], price_from, price_to, created_at))
+
+    # One statement, one transaction — instead of a commit-per-product loop
+    cursor.executemany("""
+        INSERT OR IGNORE INTO search_queries
+        (name, search_term, price_from, price_to, created_at)
+        VALUES (?, ?, ?, ?, ?)
+    """, rows)
+
     conn.commit()
     conn.close()
-    logger.info(f"✅ Created {len(PRODUCT_SPECS)} search queries")
+    logger.info("✅ Created %s search queries", len(PRODUCT_SPECS))
 
-def has_critical_exclusion_in_title(title: str) -> Tuple[bool, Optional[str]]:
-    """Check if title contains critical exclusion terms"""
-    title_lower = title.lower()
-    for term in CRITICAL_EXCLUSIONS_TITLE:
-        if term in title_lower:
+@dataclass(slots=True)
+class NormalizedListing:
+    """Listing title normalized once at ingestion and read by every filter"""
+    title_lower: str
+    tokens: frozenset
+
+    @classmethod
+    def from_title(cls, title: str) -> 'NormalizedListing':
+        title_lower = title.lower()
+        return cls(title_lower=title_lower,
+                   tokens=frozenset(TOKEN_RE.findall(title_lower)))
+
+def has_critical_exclusion_in_title(title_lower: str) -> Tuple[bool, Optional[str]]:
+    """Check if a pre-lowered title contains critical exclusion terms"""
+    if TITLE_EXCLUSION_AUTOMATON is not None:
+        for _, term in TITLE_EXCLUSION_AUTOMATON.iter(title_lower):
             return True, term
+        return False, None
+    match = TITLE_EXCLUSION_RE.search(title_lower)
+    if match:
+        return True, match.group(0)
     return False, None
 
-def has_required_drone_keywords(title: str, product_name: str) -> bool:
-    """Check if title contains required DJI Mini 2 keywords"""
-    title_lower = title.lower()
-    product_lower = product_name.lower()
-    
-    # Must have DJI
-    if 'dji' not in title_lower:
+def has_required_drone_keywords(tokens: frozenset, product_name: str) -> bool:
+    """Check if the title's token set contains required DJI Mini 2 keywords"""
+    matcher = SPEC_MATCHERS.get(product_name)
+    if matcher is not None:
+        return matcher(tokens)
+
+    # Generic fallback for names outside PRODUCT_SPECS
+    if 'dji' not in tokens:
+        return False
+    if 'mini' not in tokens and 'mini2' not in tokens:
+        return False
+    if SPEC_REQUIRES_SE.get(product_name, False) and 'se' not in tokens:
         return False
-    
-    # Must have Mini or Mini 2
-    if 'mini 2' not in title_lower and 'mini2' not in title_lower:
-        if 'mini' not in title_lower:
-            return False
-    
-    # If looking for SE specifically, check for SE
-    if 'se' in product_lower:
-        if 'se' not in title_lower:
-            return False
-    
     return True
 
-def has_critical_exclusion_in_description(description: str) -> Tuple[bool, Optional[str]]:
-    """Check if description contains critical exclusion terms"""
-    if not description:
+def has_critical_exclusion_in_description(desc_lower: str) -> Tuple[bool, Optional[str]]:
+    """Check if a pre-lowered description contains critical exclusion terms.
+
+    Like the title path, the caller lowers once and every consumer reads
+    the same normalized string.
+    """
+    if not desc_lower:
         return False, None
-    
-    desc_lower = description.lower()
-    for term in CRITICAL_EXCLUSIONS_DESC:
-        if term in desc_lower:
+
+    if DESC_EXCLUSION_AUTOMATON is not None:
+        for _, term in DESC_EXCLUSION_AUTOMATON.iter(desc_lower):
             return True, term
+        return False, None
+    match = DESC_EXCLUSION_RE.search(desc_lower)
+    if match:
+        return True, match.group(0)
     return False, None
 
+# Selectors and the review-count pattern compiled once at import; the scrape
+# loop tries them in order per page, so per-call parsing would be pure waste
+_DESCRIPTION_SELECTOR_STRINGS = (
+    'div[itemprop="description"]',
+    'div.details-list__item-value',
+    'div.item-description',
+    'p.item-description',
+)
+_REVIEW_SELECTOR_STRINGS = (
+    'span.user-feedback__rating-count',
+    'div.user-feedback__rating-count',
+    'span.feedback-reputation__rating',
+    'div.feedback-reputation__rating',
+)
+_DESCRIPTION_SELECTORS = tuple(soupsieve.compile(s) for s in _DESCRIPTION_SELECTOR_STRINGS)
+_REVIEW_SELECTORS = tuple(soupsieve.compile(s) for s in _REVIEW_SELECTOR_STRINGS)
+_REVIEW_COUNT_RE = re.compile(r'(\d+)')
+
+def _parse_listing_page(html: str) -> Tuple[Optional[str], Optional[int]]:
+    """Pull description and review count out of a listing page"""
+    description = None
+    review_count = None
+
+    if SELECTOLAX_AVAILABLE:
+        tree = SelectolaxParser(html)
+        for selector in _DESCRIPTION_SELECTOR_STRINGS:
+            node = tree.css_first(selector)
+            if node:
+                text = node.text(strip=True)
+                if text and len(text) > 10:
+                    description = text
+                    break
+        for selector in _REVIEW_SELECTOR_STRINGS:
+            node = tree.css_first(selector)
+            if node:
+                review_match = _REVIEW_COUNT_RE.search(node.text(strip=True))
+                if review_match:
+                    review_count = int(review_match.group(1))
+                    break
+        return description, review_count
+
+    soup = BeautifulSoup(html, 'html.parser')
+
+    # Try multiple selectors for description
+    for selector in _DESCRIPTION_SELECTORS:
+        desc_elem = selector.select_one(soup)
+        if desc_elem:
+            text = desc_elem.get_text(strip=True)
+            if text and len(text) > 10:
+                description = text
+                break
+
+    # Try to extract seller review count
+    for selector in _REVIEW_SELECTORS:
+        review_elem = selector.select_one(soup)
+        if review_elem:
+            review_text = review_elem.get_text(strip=True)
+            # Extract number from text like "(123)" or "123 reviews"
+            review_match = _REVIEW_COUNT_RE.search(review_text)
+            if review_match:
+                review_count = int(review_match.group(1))
+                break
+
+    return description, review_count
+
 async def scrape_vinted_description(url: str) -> Tuple[Optional[str], Optional[int]]:
     """Scrape full description and seller review count from Vinted listing page"""
     try:
-        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            description = None
-            review_count = None
-            
-            # Try multiple selectors for description
-            description_selectors = [
-                'div[itemprop="description"]',
-                'div.details-list__item-value',
-                'div.item-description',
-                'p.item-description',
-            ]
-            
-            for selector in description_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    description = desc_elem.get_text(strip=True)
-                    if description and len(description) > 10:
-                        break
-            
-            # Try to extract seller review count
-            review_selectors = [
-                'span.user-feedback__rating-count',
-                'div.user-feedback__rating-count',
-                'span.feedback-reputation__rating',
-                'div.feedback-reputation__rating',
-            ]
-            
-            for selector in review_selectors:
-                review_elem = soup.select_one(selector)
-                if review_elem:
-                    review_text = review_elem.get_text(strip=True)
-                    # Extract number from text like "(123)" or "123 reviews"
-                    review_match = re.search(r'(\d+)', review_text)
-                    if review_match:
-                        review_count = int(review_match.group(1))
-                        break
-            
-            return description, review_count
-            
+        client = get_http_client()
+        response = await client.get(url)
+        if response.status_code in THROTTLE_STATUSES:
+            await SCRAPE_LIMITER.record_throttle()
+        response.raise_for_status()
+        await SCRAPE_LIMITER.record_success()
+
+        return _parse_listing_page(response.text)
+
     except Exception as e:
-        logger.debug(f"      ⚠️  Scrape error: {e}")
+        logger.debug("      ⚠️  Scrape error: %s", e)
         return None, None
 
-async def send_discord_notification(item_data: dict):
-    """Send notification to Discord"""
+def build_embed(item_data: dict) -> dict:
+    """Build the Discord embed for one matched listing"""
+    seller_reviews = item_data.get('seller_reviews')
+    review_emoji = "⭐" if seller_reviews and seller_reviews >= 10 else "👤"
+    review_text = f"{seller_reviews} reviews" if seller_reviews else "New seller"
+
+    description_preview = item_data.get('description', 'No description available')
+    if description_preview and len(description_preview) > 200:
+        description_preview = description_preview[:200] + "..."
+
+    # One clock read per embed; footer and timestamp agree on the instant
+    now = datetime.now(timezone.utc)
+
+    return {
+        "title": f"🚁 {item_data['product_name'].upper()}",
+        "description": f"**{item_data['title']}**",
+        "color": 0x667eea,
+        "fields": [
+            {
+                "name": "💰 Price",
+                "value": f"£{item_data['price']:.2f}",
+                "inline": True
+            },
+            {
+                "name": f"{review_emoji} Seller",
+                "value": review_text,
+                "inline": True
+            },
+            {
+                "name": "📝 Description",
+                "value": description_preview,
+                "inline": False
+            }
+        ],
+        "url": item_data['url'],
+        "thumbnail": {"url": item_data['photo_url']} if item_data.get('photo_url') else None,
+        "footer": {
+            "text": f"DJI Drones Bot • {now.strftime('%H:%M:%S UTC')}"
+        },
+        "timestamp": now.isoformat()
+    }
+
+async def send_discord_embeds(embeds: List[dict]):
+    """POST embeds to the webhook, up to 10 per request (Discord's cap).
+
+    Batching turns N notifications into ceil(N/10) webhook round-trips;
+    batches go out concurrently, bounded by DISCORD_SEMAPHORE.
+    """
     if not DISCORD_WEBHOOK_URL:
         logger.warning("⚠️  No Discord webhook configured")
         return
-    
+
+    async def post_batch(batch: List[dict]):
+        async with DISCORD_SEMAPHORE:
+            try:
+                client = get_http_client()
+                response = await client.post(
+                    DISCORD_WEBHOOK_URL,
+                    content=orjson.dumps({"embeds": batch}),
+                    headers={"Content-Type": "application/json"}
+                )
+
+                if response.status_code == 404:
+                    logger.error("❌ Discord webhook not found (404) - Please update DISCORD_WEBHOOK_URL")
+                elif response.status_code != 204 and response.status_code != 200:
+                    logger.error("❌ Discord webhook error: %s", response.status_code)
+            except Exception as e:
+                logger.error("Discord notification error: %s", e)
+
+    await asyncio.gather(*(post_batch(embeds[start:start + 10])
+                           for start in range(0, len(embeds), 10)))
+
+async def send_discord_notification(item_data: dict):
+    """Send notification to Discord"""
+    await send_discord_embeds([build_embed(item_data)])
+
+# Embeds queue here so scans never wait on webhook latency; a background
+# worker drains the queue in up-to-10 batches
+DISCORD_QUEUE: asyncio.Queue = asyncio.Queue()
+
+async def discord_worker():
+    """Drain queued embeds, batching to Discord's 10-per-message cap"""
+    while True:
+        batch = [await DISCORD_QUEUE.get()]
+        while len(batch) < 10:
+            try:
+                batch.append(DISCORD_QUEUE.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            await send_discord_embeds(batch)
+        finally:
+            for _ in batch:
+                DISCORD_QUEUE.task_done()
+
+async def fetch_search_pages(scraper, search_term: str, price_from: float,
+                             price_to: float,
+                             seen_ids: Optional[set] = None) -> List:
+    """Fetch all result pages for a search concurrently.
+
+    Pages are requested in parallel (bounded by PAGE_SEMAPHORE and paced by
+    PAGE_LIMITER) so wall time is max-latency rather than sum-latency; the
+    combined result is truncated at the first empty or short page. With
+    "newest_first" ordering, a wave containing only already-tracked ids means
+    everything deeper is old too, so pagination stops there as well.
+    """
+    async def fetch_page(page: int):
+        async with PAGE_SEMAPHORE:
+            for attempt in range(MAX_RETRIES + 1):
+                await PAGE_LIMITER.acquire()
+                try:
+                    logger.info("   📄 Fetching page %s/%s...", page, MAX_PAGES_PER_SEARCH)
+                    return await scraper.search(params={
+                        "search_text": search_term,
+                        "price_from": price_from,
+                        "price_to": price_to,
+                        "per_page": ITEMS_PER_PAGE,
+                        "page": page,
+                        "order": "newest_first"
+                    })
+                except Exception as e:
+                    if attempt >= MAX_RETRIES:
+                        logger.error("      ❌ Page %s failed after %s retries: %s",
+                                     page, MAX_RETRIES, e)
+                        return None
+                    # Exponential backoff with jitter so retries from
+                    # concurrent page fetches don't land in lockstep
+                    delay = min(60, RETRY_DELAY * 2 ** attempt) * random.uniform(0.5, 1.5)
+                    logger.warning("      ⚠️ Page %s error (attempt %s): %s — retrying in %.1fs",
+                                   page, attempt + 1, e, delay)
+                    await asyncio.sleep(delay)
+
+    all_items = []
+    # Fetch in waves of PAGE_BATCH_SIZE so deep scans overlap requests but a
+    # short result set doesn't trigger all 50 page fetches
+    for start in range(1, MAX_PAGES_PER_SEARCH + 1, PAGE_BATCH_SIZE):
+        page_range = range(start, min(start + PAGE_BATCH_SIZE, MAX_PAGES_PER_SEARCH + 1))
+        pages = await asyncio.gather(*(fetch_page(p) for p in page_range))
+
+        finished = False
+        wave_new = 0
+        for page_num, items in zip(page_range, pages):
+            if not items:
+                logger.info("      ℹ️  No more items on page %s", page_num)
+                finished = True
+                break
+            all_items.extend(items)
+            if seen_ids is not None:
+                wave_new += sum(1 for it in items if str(it.id) not in seen_ids)
+            if len(items) < ITEMS_PER_PAGE:
+                logger.info("      ℹ️  Last page reached (%s items)", len(items))
+                finished = True
+                break
+        if finished:
+            break
+        if seen_ids is not None and wave_new == 0:
+            logger.info("      ℹ️  No new listings in pages %s-%s — stopping pagination",
+                        page_range.start, page_range[-1])
+            break
+    return all_items
+
+def _flush_cycle_writes(conn: sqlite3.Connection, pending_items: List[tuple],
+                        found_counts: Dict[int, int],
+                        checked_updates: List[tuple]):
+    """Flush a cycle's batched writes in one transaction (runs on the writer thread)"""
+    # Close any implicit transaction another statement may have opened
+    # before starting our own
+    if conn.in_transaction:
+        conn.commit()
+    if not pending_items and not checked_updates:
+        return
+    # BEGIN IMMEDIATE takes the write lock up front, avoiding a mid-transaction
+    # SQLITE_BUSY upgrade if a reader holds the database
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        seller_reviews = item_data.get('seller_reviews')
-        review_emoji = "⭐" if seller_reviews and seller_reviews >= 10 else "👤"
-        review_text = f"{seller_reviews} reviews" if seller_reviews else "New seller"
-        
-        description_preview = item_data.get('description', 'No description available')
-        if description_preview and len(description_preview) > 200:
-            description_preview = description_preview[:200] + "..."
-        
-        embed = {
-            "title": f"🚁 {item_data['product_name'].upper()}",
-            "description": f"**{item_data['title']}**",
-            "color": 0x667eea,
-            "fields": [
-                {
-                    "name": "💰 Price",
-                    "value": f"£{item_data['price']:.2f}",
-                    "inline": True
-                },
-                {
-                    "name": f"{review_emoji} Seller",
-                    "value": review_text,
-                    "inline": True
-                },
-                {
-                    "name": "📝 Description",
-                    "value": description_preview,
-                    "inline": False
-                }
-            ],
-            "url": item_data['url'],
-            "thumbnail": {"url": item_data['photo_url']} if item_data.get('photo_url') else None,
-            "footer": {
-                "text": f"DJI Drones Bot • {datetime.utcnow().strftime('%H:%M:%S UTC')}"
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(DISCORD_WEBHOOK_URL, json={"embeds": [embed]})
-            
-            if response.status_code == 404:
-                logger.error("❌ Discord webhook not found (404) - Please update DISCORD_WEBHOOK_URL")
-            elif response.status_code != 204 and response.status_code != 200:
-                logger.error(f"❌ Discord webhook error: {response.status_code}")
-            
-    except Exception as e:
-        logger.error(f"Discord notification error: {e}")
+        conn.executemany("""
+            INSERT OR IGNORE INTO tracked_items
+            (vinted_id, search_query_id, title, price, url, photo_url, description,
+             seller_reviews, passed_title_filter, passed_desc_filter, notified_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, pending_items)
+        conn.executemany(
+            "UPDATE search_queries SET total_found = total_found + ? WHERE id = ?",
+            [(count, qid) for qid, count in found_counts.items()]
+        )
+        conn.executemany(
+            "UPDATE search_queries SET last_checked = ? WHERE id = ?",
+            checked_updates
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
 
 async def run_scan_cycle():
     """Run a complete scan cycle"""
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = get_writer_conn()
     cursor = conn.cursor()
     
-    cursor.execute("""
-        SELECT id, name, search_term, price_from, price_to
-        FROM search_queries
-        WHERE enabled = TRUE
-        ORDER BY RANDOM()
-        LIMIT ?
-    """, (MAX_PRODUCTS_PER_CYCLE,))
-    
-    queries = cursor.fetchall()
+    # ORDER BY RANDOM() shuffles the whole table to pick a handful of rows;
+    # sampling the (indexed) id list in Python touches only what's needed
+    cursor.execute("SELECT id FROM search_queries WHERE enabled = TRUE")
+    enabled_ids = [row[0] for row in cursor.fetchall()]
+    picked = random.sample(enabled_ids, min(MAX_PRODUCTS_PER_CYCLE, len(enabled_ids)))
+
+    queries = []
+    if picked:
+        placeholders = ','.join('?' * len(picked))
+        cursor.execute(f"""
+            SELECT id, name, search_term, price_from, price_to
+            FROM search_queries
+            WHERE id IN ({placeholders})
+        """, picked)
+        queries = cursor.fetchall()
     
     if not queries:
         logger.warning("⚠️  No enabled search queries found")
-        conn.close()
         return
     
-    logger.info(f"\n{'='*60}")
-    logger.info(f"🚁 STARTING SCAN CYCLE - DJI Drones Bot")
-    logger.info(f"{'='*60}")
-    logger.info(f"🕐 Started: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-    logger.info(f"📦 Processing: {len(queries)} products")
-    logger.info(f"")
+    logger.info("\n" + "=" * 60)
+    logger.info("🚁 STARTING SCAN CYCLE - DJI Drones Bot")
+    logger.info("=" * 60)
+    logger.info("🕐 Started: %s", datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'))
+    logger.info("📦 Processing: %s products", len(queries))
+    logger.info("")
     
     cycle_stats = {
         'total_items': 0,
@@ -397,142 +974,154 @@ async def run_scan_cycle():
         'filtered_title': 0,
         'filtered_desc': 0
     }
-    
+
+    # Rows accumulated during the cycle and flushed in one transaction,
+    # so the cycle pays a single fsync instead of one per item
+    pending_items: List[tuple] = []
+    found_counts: Dict[int, int] = {}
+    checked_updates: List[tuple] = []
+
+    # One prefetch instead of a SELECT round-trip per scanned item
+    cursor.execute("SELECT vinted_id FROM tracked_items")
+    seen_ids = {row[0] for row in cursor.fetchall()}
+
     try:
-        scraper = AsyncVintedScraper(baseurl="https://www.vinted.co.uk")
-        
-        for idx, query in enumerate(queries, 1):
+        scraper = get_scraper()
+
+        async def scan_product(idx: int, query: tuple):
             query_id, name, search_term, price_from, price_to = query
             
-            logger.info(f"\n{'─'*60}")
-            logger.info(f"🔍 [{idx}/{len(queries)}] {name}")
-            logger.info(f"{'─'*60}")
-            logger.info(f"   💷 Price range: £{price_from:.2f} - £{price_to:.2f}")
-            logger.info(f"")
-            
-            all_items = []
-            
-            # Paginate through results
-            for page in range(1, MAX_PAGES_PER_SEARCH + 1):
-                try:
-                    logger.info(f"   📄 Fetching page {page}/{MAX_PAGES_PER_SEARCH}...")
-                    
-                    search_params = {
-                        "search_text": search_term,
-                        "price_from": price_from,
-                        "price_to": price_to,
-                        "per_page": ITEMS_PER_PAGE,
-                        "page": page,
-                        "order": "newest_first"
-                    }
-                    
-                    items = await scraper.search(params=search_params)
-                    
-                    if not items:
-                        logger.info(f"      ℹ️  No more items on page {page}")
-                        break
-                    
-                    all_items.extend(items)
-                    logger.info(f"      ✅ Found {len(items)} items")
-                    
-                    if len(items) < ITEMS_PER_PAGE:
-                        logger.info(f"      ℹ️  Last page reached ({len(items)} items)")
-                        break
-                    
-                    if page < MAX_PAGES_PER_SEARCH:
-                        await asyncio.sleep(PAGE_DELAY)
-                        
-                except Exception as e:
-                    logger.error(f"      ❌ Page {page} error: {e}")
-                    break
+            logger.info("\n" + "─" * 60)
+            logger.info("🔍 [%s/%s] %s", idx, len(queries), name)
+            logger.info("─" * 60)
+            logger.info("   💷 Price range: £%.2f - £%.2f", price_from, price_to)
+            logger.info("")
             
+            # Paginate through results (pages fetched concurrently)
+            all_items = await fetch_search_pages(scraper, search_term, price_from,
+                                                 price_to, seen_ids=seen_ids)
+
             cycle_stats['total_items'] += len(all_items)
-            logger.info(f"   📊 Total items fetched: {len(all_items)}")
-            logger.info(f"")
+            logger.info("   📊 Total items fetched: %s", len(all_items))
+            logger.info("")
             
             # Process items
             product_already_tracked = 0
             product_passed = 0
             product_filtered = 0
+            notifications: List[dict] = []
             
+            # Phase 1: title filtering (pure CPU, no network)
+            candidates = []
             for item in all_items:
-                try:
-                    # Check if already tracked
-                    cursor.execute("SELECT id FROM tracked_items WHERE vinted_id = ?", (str(item.id),))
-                    if cursor.fetchone():
-                        product_already_tracked += 1
-                        continue
-                    
-                    logger.info(f"   🆕 New item #{item.id}: {item.title[:60]}...")
-                    
-                    # Step 1: Title filter - exclusions
-                    has_exclusion, term = has_critical_exclusion_in_title(item.title)
+                vinted_id = str(item.id)
+                if vinted_id in seen_ids:
+                    product_already_tracked += 1
+                    continue
+
+                logger.info("   🆕 New item #%s: %.60s...", item.id, item.title)
+
+                norm = NormalizedListing.from_title(item.title)
+
+                # Step 1: Title filter - exclusions
+                has_exclusion, term = has_critical_exclusion_in_title(norm.title_lower)
+                if has_exclusion:
+                    logger.info("      ❌ Title filter: '%s'", term)
+                    product_filtered += 1
+                    cycle_stats['filtered_title'] += 1
+                    continue
+
+                # Step 1.5: Check for required drone keywords
+                if not has_required_drone_keywords(norm.tokens, name):
+                    logger.info("      ❌ Missing required DJI Mini 2 keywords")
+                    product_filtered += 1
+                    cycle_stats['filtered_title'] += 1
+                    continue
+
+                # Step 1.7: if the search API already returned a description,
+                # run the exclusion check on it now — a hit here saves the
+                # whole listing-page fetch in Phase 2
+                api_description = getattr(item, 'description', None)
+                if api_description:
+                    has_exclusion, term = has_critical_exclusion_in_description(
+                        api_description.lower())
                     if has_exclusion:
-                        logger.info(f"      ❌ Title filter: '{term}'")
-                        product_filtered += 1
-                        cycle_stats['filtered_title'] += 1
-                        continue
-                    
-                    # Step 1.5: Check for required drone keywords
-                    if not has_required_drone_keywords(item.title, name):
-                        logger.info(f"      ❌ Missing required DJI Mini 2 keywords")
+                        logger.info("      ❌ Description filter (from API): '%s'", term)
                         product_filtered += 1
-                        cycle_stats['filtered_title'] += 1
+                        cycle_stats['filtered_desc'] += 1
                         continue
-                    
-                    logger.info(f"      ✅ Title filter passed")
-                    cycle_stats['passed_title_filter'] += 1
-                    
-                    # Step 2: Green light - scrape description
-                    logger.info(f"      🔍 Scraping description & seller info...")
-                    description, review_count = await scrape_vinted_description(item.url)
+
+                logger.info("      ✅ Title filter passed")
+                cycle_stats['passed_title_filter'] += 1
+                candidates.append(item)
+
+            # Phase 2: green light - scrape descriptions concurrently;
+            # the semaphore bounds in-flight requests against Vinted
+            if candidates:
+                logger.info("   🔍 Scraping %s candidate listings...", len(candidates))
+
+            async def fetch_details(candidate):
+                async with SCRAPE_LIMITER:
+                    await SCRAPE_PACER.acquire()
+                    return await scrape_vinted_description(candidate.url)
+
+            details = await asyncio.gather(*(fetch_details(c) for c in candidates),
+                                           return_exceptions=True)
+
+            # Phase 3: quality checks, queue for insert, notify
+            for item, detail in zip(candidates, details):
+                try:
+                    if isinstance(detail, BaseException):
+                        logger.debug("      ⚠️  Scrape error for #%s: %s", item.id, detail)
+                        description, review_count = None, None
+                    else:
+                        description, review_count = detail
                     cycle_stats['descriptions_scraped'] += 1
-                    
+
+                    logger.info("   📦 Item #%s: %.60s...", item.id, item.title)
+
                     if description:
-                        logger.info(f"      ✅ Description: {description[:80]}...")
+                        logger.info("      ✅ Description: %.80s...", description)
                     else:
-                        logger.info(f"      ⚠️  No description found")
-                    
+                        logger.info("      ⚠️  No description found")
+
                     if review_count is not None:
-                        logger.info(f"      ⭐ Seller reviews: {review_count}")
+                        logger.info("      ⭐ Seller reviews: %s", review_count)
                     else:
-                        logger.info(f"      ⚠️  Could not fetch seller reviews")
-                    
+                        logger.info("      ⚠️  Could not fetch seller reviews")
+
                     # Step 2.5: Filter out sellers with 0 reviews
                     if review_count is not None and review_count < MIN_SELLER_REVIEWS:
-                        logger.info(f"      ❌ Seller has {review_count} reviews (minimum: {MIN_SELLER_REVIEWS})")
+                        logger.info("      ❌ Seller has %s reviews (minimum: %s)", review_count, MIN_SELLER_REVIEWS)
                         cycle_stats['filtered_desc'] += 1
                         product_filtered += 1
                         continue
-                    
-                    # Step 3: Description filter
+
+                    # Step 3: Description filter (lower once, reuse normalized)
                     if description:
-                        has_exclusion, term = has_critical_exclusion_in_description(description)
+                        has_exclusion, term = has_critical_exclusion_in_description(description.lower())
                         if has_exclusion:
-                            logger.info(f"      ❌ Description filter: '{term}'")
+                            logger.info("      ❌ Description filter: '%s'", term)
                             cycle_stats['filtered_desc'] += 1
                             product_filtered += 1
                             continue
-                    
-                    logger.info(f"      ✅ Description filter passed")
+
+                    logger.info("      ✅ Description filter passed")
                     cycle_stats['passed_desc_filter'] += 1
-                    
-                    # Extract photo URL properly
+
+                    # Extract photo URL once; DB row and Discord embed share it
                     photo_url = None
                     if hasattr(item, 'photo'):
                         if isinstance(item.photo, dict):
                             photo_url = item.photo.get('url') or item.photo.get('full_size_url')
                         elif isinstance(item.photo, str):
                             photo_url = item.photo
-                    
-                    # Save to database
-                    cursor.execute("""
-                        INSERT INTO tracked_items 
-                        (vinted_id, search_query_id, title, price, url, photo_url, description,
-                         seller_reviews, passed_title_filter, passed_desc_filter, notified_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        str(item.id),
+
+                    # Queue for the single end-of-cycle batch insert
+                    vinted_id = str(item.id)
+                    seen_ids.add(vinted_id)
+                    pending_items.append((
+                        vinted_id,
                         query_id,
                         item.title,
                         item.price,
@@ -542,110 +1131,143 @@ async def run_scan_cycle():
                         review_count,
                         True,
                         True,
-                        datetime.utcnow().isoformat()
+                        time.time_ns()
                     ))
-                    
-                    cursor.execute("UPDATE search_queries SET total_found = total_found + 1 WHERE id = ?",
-                                 (query_id,))
-                    
+                    found_counts[query_id] = found_counts.get(query_id, 0) + 1
+
                     product_passed += 1
                     cycle_stats['sent_to_discord'] += 1
-                    
-                    logger.info(f"      💰 Price: £{item.price:.2f}")
-                    logger.info(f"      📬 Sending to Discord...")
-                    
-                    # Extract photo URL for Discord
-                    photo_url_discord = None
-                    if hasattr(item, 'photo'):
-                        if isinstance(item.photo, dict):
-                            photo_url_discord = item.photo.get('url') or item.photo.get('full_size_url')
-                        elif isinstance(item.photo, str):
-                            photo_url_discord = item.photo
-                    
-                    # Send to Discord
-                    await send_discord_notification({
+
+                    logger.info("      💰 Price: £%.2f", item.price)
+
+                    notifications.append({
                         'product_name': name,
                         'title': item.title,
                         'price': item.price,
                         'url': item.url,
-                        'photo_url': photo_url_discord,
+                        'photo_url': photo_url,
                         'description': description,
                         'seller_reviews': review_count
                     })
-                    
-                    logger.info(f"      ✅ Notification sent!")
-                    logger.info("")
-                    
-                    # Delay between items
-                    if product_passed < len(all_items):
-                        await asyncio.sleep(SCRAPE_DELAY)
-                    
+
                 except Exception as e:
-                    logger.error(f"      ❌ Error processing item #{item.id}: {e}")
+                    logger.error("      ❌ Error processing item #%s: %s", item.id, e)
                     continue
+
+            # Hand the product's notifications to the webhook worker; the
+            # scan moves on without waiting for Discord round-trips
+            if notifications:
+                logger.info("   📬 Queueing %s notifications for Discord...", len(notifications))
+                for n in notifications:
+                    DISCORD_QUEUE.put_nowait(build_embed(n))
+                notifications.clear()
             
-            logger.info(f"\n{'─'*60}")
-            logger.info(f"📊 {name} - Summary:")
-            logger.info(f"   📦 Total scanned: {len(all_items)}")
-            logger.info(f"   ⭐ Already tracked: {product_already_tracked}")
-            logger.info(f"   ✅ Passed filters: {product_passed}")
-            logger.info(f"   ❌ Filtered out: {product_filtered}")
-            logger.info(f"   📬 Sent to Discord: {product_passed}")
-            logger.info(f"{'─'*60}")
-            
-            cursor.execute("UPDATE search_queries SET last_checked = ? WHERE id = ?",
-                         (datetime.utcnow().isoformat(), query_id))
+            logger.info("\n" + "─" * 60)
+            logger.info("📊 %s - Summary:", name)
+            logger.info("   📦 Total scanned: %s", len(all_items))
+            logger.info("   ⭐ Already tracked: %s", product_already_tracked)
+            logger.info("   ✅ Passed filters: %s", product_passed)
+            logger.info("   ❌ Filtered out: %s", product_filtered)
+            logger.info("   📬 Sent to Discord: %s", product_passed)
+            logger.info("─" * 60)
             
-            if idx < len(queries):
-                logger.info(f"\n💤 Waiting {PRODUCT_DELAY}s before next product...")
-                await asyncio.sleep(PRODUCT_DELAY)
-    
+            checked_updates.append((datetime.now(timezone.utc).isoformat(), query_id))
+
+        # Scan the cycle's products concurrently; the semaphore keeps the
+        # combined page/scrape fan-out within what one product used to drive
+        async def scan_bounded(idx: int, query: tuple):
+            async with PRODUCT_SEMAPHORE:
+                await PRODUCT_PACER.acquire()
+                await scan_product(idx, query)
+
+        results = await asyncio.gather(
+            *(scan_bounded(i, q) for i, q in enumerate(queries, 1)),
+            return_exceptions=True
+        )
+        for query, res in zip(queries, results):
+            if isinstance(res, BaseException):
+                logger.error("❌ Product scan failed for %s: %s", query[1], res)
+
     except Exception as e:
-        logger.error(f"❌ Fatal error: {e}")
+        logger.error("❌ Fatal error: %s", e)
         import traceback
         logger.error(traceback.format_exc())
     
     finally:
-        logger.info(f"\n💾 Committing database changes...")
-        conn.commit()
-        conn.close()
-        logger.info(f"✅ Database updated")
+        logger.info("\n💾 Committing database changes...")
+        async with WRITER_LOCK:
+            await asyncio.get_running_loop().run_in_executor(
+                WRITER_EXECUTOR, _flush_cycle_writes, conn, pending_items,
+                found_counts, checked_updates
+            )
+        logger.info("✅ Database updated (%s new items)", len(pending_items))
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"📊 CYCLE COMPLETE - DJI Drones Bot")
-        logger.info(f"{'='*60}")
-        logger.info(f"🕐 Completed: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        logger.info(f"")
-        logger.info(f"📈 Cycle Statistics:")
-        logger.info(f"   📦 Total items scanned: {cycle_stats['total_items']:,}")
-        logger.info(f"   ⭐ Already tracked: {cycle_stats['already_tracked']}")
-        logger.info(f"   ✅ Passed title filters: {cycle_stats['passed_title_filter']}")
-        logger.info(f"   📝 Descriptions scraped: {cycle_stats['descriptions_scraped']}")
-        logger.info(f"   ✅ Passed description filters: {cycle_stats['passed_desc_filter']}")
-        logger.info(f"   📬 Sent to Discord: {cycle_stats['sent_to_discord']}")
-        logger.info(f"   ❌ Filtered by title: {cycle_stats['filtered_title']}")
-        logger.info(f"   ❌ Filtered by description: {cycle_stats['filtered_desc']}")
-        logger.info(f"{'='*60}")
-        logger.info(f"\n⏰ Next cycle in {CYCLE_INTERVAL//60} minutes...\n")
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 CYCLE COMPLETE - DJI Drones Bot")
+        logger.info("=" * 60)
+        logger.info("🕐 Completed: %s", datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'))
+        logger.info("")
+        logger.info("📈 Cycle Statistics:")
+        logger.info("   📦 Total items scanned: %s", format(cycle_stats['total_items'], ','))
+        logger.info("   ⭐ Already tracked: %s", cycle_stats['already_tracked'])
+        logger.info("   ✅ Passed title filters: %s", cycle_stats['passed_title_filter'])
+        logger.info("   📝 Descriptions scraped: %s", cycle_stats['descriptions_scraped'])
+        logger.info("   ✅ Passed description filters: %s", cycle_stats['passed_desc_filter'])
+        logger.info("   📬 Sent to Discord: %s", cycle_stats['sent_to_discord'])
+        logger.info("   ❌ Filtered by title: %s", cycle_stats['filtered_title'])
+        logger.info("   ❌ Filtered by description: %s", cycle_stats['filtered_desc'])
+        logger.info("=" * 60)
+        logger.info("\n⏰ Next cycle in %s minutes...\n", CYCLE_MINUTES)
+
+# Set (e.g. via POST /trigger) to start the next cycle without waiting out
+# the interval; the scheduler clears it at the top of each cycle
+CYCLE_TRIGGER = asyncio.Event()
 
 async def scheduler():
     """Background scheduler for scan cycles"""
     await asyncio.sleep(5)
-    
+
     while True:
+        cycle_start = time.monotonic()
+        CYCLE_TRIGGER.clear()
         try:
             await run_scan_cycle()
         except Exception as e:
-            logger.error(f"❌ Scheduler error: {e}")
+            logger.error("❌ Scheduler error: %s", e)
             import traceback
             logger.error(traceback.format_exc())
-        
-        logger.info(f"💤 Waiting {CYCLE_INTERVAL}s before next cycle...\n")
-        await asyncio.sleep(CYCLE_INTERVAL)
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize on startup"""
+        # Let SQLite refresh its query planner stats between cycles
+        try:
+            conn = get_conn()
+            conn.execute("PRAGMA optimize")
+            conn.close()
+        except Exception as e:
+            logger.debug("PRAGMA optimize failed: %s", e)
+
+        # Rebuild the dashboard off-request while the data is fresh, so the
+        # next viewer is served this cycle's numbers straight from cache
+        try:
+            async with _dashboard_lock:
+                await asyncio.to_thread(_build_dashboard)
+        except Exception as e:
+            logger.debug("Dashboard refresh failed: %s", e)
+
+        # Sleep until the next deadline, not a fixed interval on top of the
+        # cycle's runtime — a slow scan no longer pushes every later cycle back
+        elapsed = time.monotonic() - cycle_start
+        wait = max(0.0, CYCLE_INTERVAL - elapsed)
+        logger.info("💤 Cycle took %.0fs; next cycle in %.0fs\n", elapsed, wait)
+        try:
+            # The wait doubles as the manual-trigger window: setting
+            # CYCLE_TRIGGER starts the next cycle immediately
+            await asyncio.wait_for(CYCLE_TRIGGER.wait(), timeout=wait)
+            logger.info("⏭️  Cycle triggered manually")
+        except asyncio.TimeoutError:
+            pass
+
+async def _startup():
+    """Initialize on startup (runs from the lifespan context)"""
     logger.info("\n" + "="*60)
     logger.info("🚁 DJI DRONES BOT STARTING")
     logger.info("="*60)
@@ -657,261 +1279,204 @@ async def startup_event():
     init_database()
     await create_search_queries()
     
-    logger.info(f"\n⚙️  DJI DRONES BOT CONFIGURATION:")
-    logger.info(f"   🚁 Specialty: DJI Mini 2 & Mini 2 SE Only")
-    logger.info(f"   🎯 Products tracked: {len(PRODUCT_SPECS)}")
-    logger.info(f"   🔍 Pages per product: {MAX_PAGES_PER_SEARCH} (DEEP SCAN)")
-    logger.info(f"   📦 Max items per product: ~{MAX_PAGES_PER_SEARCH * ITEMS_PER_PAGE:,}")
-    logger.info(f"   🔄 Products per cycle: {MAX_PRODUCTS_PER_CYCLE} (ALL)")
-    logger.info(f"   ⏱️  Cycle time: {CYCLE_INTERVAL//60} minutes (FREQUENT)")
-    logger.info(f"   💰 DJI Mini 2 max buy: £180")
-    logger.info(f"   💰 DJI Mini 2 SE max buy: £140")
-    logger.info(f"   ⭐ Min seller reviews: {MIN_SELLER_REVIEWS}")
-    logger.info(f"   🔍 Description scraping: ✅ ENABLED")
-    logger.info(f"   🔌 Vinted scraper: {'✅ AVAILABLE' if VINTED_AVAILABLE else '❌ NOT INSTALLED'}")
-    logger.info(f"="*60 + "\n")
+    logger.info("\n⚙️  DJI DRONES BOT CONFIGURATION:")
+    logger.info("   🚁 Specialty: DJI Mini 2 & Mini 2 SE Only")
+    logger.info("   🎯 Products tracked: %s", len(PRODUCT_SPECS))
+    logger.info("   🔍 Pages per product: %s (DEEP SCAN)", MAX_PAGES_PER_SEARCH)
+    logger.info("   📦 Max items per product: ~%s", MAX_ITEMS_PER_PRODUCT)
+    logger.info("   🔄 Products per cycle: %s (ALL)", MAX_PRODUCTS_PER_CYCLE)
+    logger.info("   ⏱️  Cycle time: %s minutes (FREQUENT)", CYCLE_MINUTES)
+    logger.info("   💰 DJI Mini 2 max buy: £180")
+    logger.info("   💰 DJI Mini 2 SE max buy: £140")
+    logger.info("   ⭐ Min seller reviews: %s", MIN_SELLER_REVIEWS)
+    logger.info("   🔍 Description scraping: ✅ ENABLED")
+    logger.info("   🔌 Vinted scraper: %s", '✅ AVAILABLE' if VINTED_AVAILABLE else '❌ NOT INSTALLED')
+    logger.info("=" * 60 + "\n")
     
-    # Start scheduler
-    asyncio.create_task(scheduler())
+
+# Dashboard cache - the data only changes once per cycle, so serve
+# pre-rendered UTF-8 bytes to every request inside the TTL window
+DASHBOARD_CACHE_TTL = 60
+_dashboard_cache: Dict[str, object] = {'html': None, 'at': 0.0, 'sig': None, 'etag': None,
+                                       'modified': None}
+_dashboard_lock = asyncio.Lock()
+
+# Dashboard template loaded and compiled once at import (auto_reload=False);
+# a render swaps in the cycle's numbers instead of re-parsing ~150 lines of
+# markup per request, and autoescape covers listing titles lifted straight
+# from Vinted
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    auto_reload=False,
+    autoescape=True,
+)
+DASHBOARD_TEMPLATE = _JINJA_ENV.get_template("dashboard.html")
+
+def _dashboard_response(request: Request, body: bytes) -> Response:
+    """Serve the page — or an empty 304 if the client's copy is current"""
+    etag = _dashboard_cache['etag']
+    # Let clients reuse their copy for 30s without asking; pairs with the
+    # server-side TTL cache so most refreshes cost nothing at all
+    headers = {'Cache-Control': 'public, max-age=30'}
+    if _dashboard_cache['modified'] is not None:
+        headers['Last-Modified'] = _dashboard_cache['modified']
+    if etag is not None:
+        headers['ETag'] = etag
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=body, headers=headers)
 
 @app.get("/", response_class=HTMLResponse)
-async def home():
+async def home(request: Request):
     """Bot dashboard"""
-    conn = sqlite3.connect(DATABASE_FILE)
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT COUNT(*) FROM tracked_items")
-    total_items = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM tracked_items WHERE passed_title_filter = TRUE")
-    passed_title = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM tracked_items WHERE passed_desc_filter = TRUE")
-    passed_desc = cursor.fetchone()[0]
-    
-    cursor.execute("""
-        SELECT name, COUNT(tracked_items.id) as count
-        FROM search_queries
-        LEFT JOIN tracked_items ON search_queries.id = tracked_items.search_query_id
-        WHERE search_queries.enabled = TRUE
-        GROUP BY search_queries.id
-        ORDER BY count DESC
-        LIMIT 10
-    """)
-    top_products = cursor.fetchall()
-    
-    cursor.execute("""
-        SELECT title, price, url, notified_at
-        FROM tracked_items
-        ORDER BY notified_at DESC
-        LIMIT 20
-    """)
-    recent_items = cursor.fetchall()
-    
-    conn.close()
-    
-    html = f"""
-    <html>
-        <head>
-            <title>DJI Drones Bot Dashboard</title>
-            <meta http-equiv="refresh" content="60">
-            <style>
-                body {{ 
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                    min-height: 100vh; 
-                    padding: 20px; 
-                    margin: 0;
-                }}
-                .container {{ 
-                    max-width: 1200px; 
-                    margin: 0 auto; 
-                    background: white; 
-                    padding: 40px; 
-                    border-radius: 20px; 
-                    box-shadow: 0 20px 60px rgba(0,0,0,0.3); 
-                }}
-                h1 {{ 
-                    color: #333; 
-                    font-size: 42px; 
-                    margin-bottom: 10px; 
-                    display: flex;
-                    align-items: center;
-                    gap: 15px;
-                }}
-                .subtitle {{ 
-                    color: #666; 
-                    font-size: 18px; 
-                    margin-bottom: 30px; 
-                }}
-                .stats {{ 
-                    display: grid; 
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); 
-                    gap: 20px; 
-                    margin: 30px 0; 
-                }}
-                .stat {{ 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                    padding: 25px; 
-                    border-radius: 15px; 
-                    color: white; 
-                    box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-                }}
-                .stat-value {{ 
-                    font-size: 36px; 
-                    font-weight: bold; 
-                    margin: 10px 0; 
-                }}
-                .stat-label {{ 
-                    font-size: 14px; 
-                    opacity: 0.9; 
-                }}
-                .section {{ 
-                    margin: 30px 0; 
-                    background: #f8f9fa; 
-                    padding: 25px; 
-                    border-radius: 15px; 
-                }}
-                .section h2 {{ 
-                    color: #333; 
-                    margin-top: 0; 
-                    font-size: 24px;
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                }}
-                table {{ 
-                    width: 100%; 
-                    border-collapse: collapse; 
-                    margin-top: 15px; 
-                }}
-                th {{ 
-                    background: #667eea; 
-                    color: white; 
-                    padding: 12px; 
-                    text-align: left; 
-                    font-weight: 600;
-                }}
-                td {{ 
-                    padding: 12px; 
-                    border-bottom: 1px solid #ddd; 
-                }}
-                tr:hover {{ 
-                    background: #f0f0f0; 
-                }}
-                .deal-item {{ 
-                    background: white; 
-                    padding: 15px; 
-                    margin: 10px 0; 
-                    border-radius: 10px; 
-                    border-left: 4px solid #667eea;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                }}
-                .deal-title {{ 
-                    font-weight: bold; 
-                    color: #333; 
-                    margin-bottom: 8px;
-                }}
-                .deal-info {{ 
-                    color: #666; 
-                    font-size: 14px;
-                    display: flex;
-                    gap: 20px;
-                    flex-wrap: wrap;
-                }}
-                a {{ 
-                    color: #667eea; 
-                    text-decoration: none; 
-                }}
-                a:hover {{ 
-                    text-decoration: underline; 
-                }}
-                .status {{ 
-                    display: inline-block; 
-                    padding: 4px 12px; 
-                    background: #00a86b; 
-                    color: white; 
-                    border-radius: 12px; 
-                    font-size: 12px; 
-                    font-weight: bold;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>
-                    <span>🚁</span> DJI Drones Bot
-                </h1>
-                <div class="subtitle">
-                    <span class="status">● LIVE</span>
-                    Tracking DJI Mini 2 & Mini 2 SE • Deep scan: 50 pages • Cycle: 10 min • Min reviews: 1 • Auto-refresh: 60s
-                </div>
-                
-                <div class="stats">
-                    <div class="stat">
-                        <div class="stat-label">💎 Total Deals Found</div>
-                        <div class="stat-value">{total_items}</div>
-                    </div>
-                    <div class="stat">
-                        <div class="stat-label">✅ Title Filter Pass</div>
-                        <div class="stat-value">{passed_title}</div>
-                    </div>
-                    <div class="stat">
-                        <div class="stat-label">📝 Description Pass</div>
-                        <div class="stat-value">{passed_desc}</div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>🏆 Top Products</h2>
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>Product</th>
-                                <th>Deals Found</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {''.join(f'<tr><td>{name}</td><td>{count}</td></tr>' for name, count in top_products)}
-                        </tbody>
-                    </table>
-                </div>
-                
-                <div class="section">
-                    <h2>🔥 Recent Deals (Last 20)</h2>
-                    <div>
-                        {''.join(f'''
-                            <div class="deal-item">
-                                <div class="deal-title">{title}</div>
-                                <div class="deal-info">
-                                    <span>💰 £{price:.2f}</span>
-                                    <span>🕐 {notified_at.split('T')[1][:8]}</span>
-                                    <span><a href="{url}" target="_blank">🔗 View Listing</a></span>
-                                </div>
-                            </div>
-                        ''' for title, price, url, notified_at in recent_items) if recent_items else '<p style="padding: 20px; text-align: center; color: #999;">No deals yet...</p>'}
-                    </div>
-                </div>
-            </div>
-        </body>
-    </html>
-    """
-    return HTMLResponse(content=html)
+    cached = _dashboard_cache['html']
+    if cached is not None and time.monotonic() - _dashboard_cache['at'] < DASHBOARD_CACHE_TTL:
+        return _dashboard_response(request, cached)
+
+    async with _dashboard_lock:
+        # Re-check after the lock: another request may have just rebuilt it
+        cached = _dashboard_cache['html']
+        if cached is not None and time.monotonic() - _dashboard_cache['at'] < DASHBOARD_CACHE_TTL:
+            return _dashboard_response(request, cached)
+        # SQLite + Jinja work runs on a worker thread so a cold rebuild
+        # doesn't stall every other coroutine on the loop
+        return _dashboard_response(request, await asyncio.to_thread(_build_dashboard))
+
+# Dashboard SQL as module constants: the identical string objects hit each
+# connection's prepared-statement cache on every rebuild
+_SQL_DASHBOARD_COUNTS = """
+    SELECT COUNT(*),
+           COALESCE(SUM(passed_title_filter), 0),
+           COALESCE(SUM(passed_desc_filter), 0)
+    FROM tracked_items
+"""
+_SQL_TOP_PRODUCTS = """
+    SELECT name, total_found
+    FROM search_queries
+    WHERE enabled = TRUE
+    ORDER BY total_found DESC
+    LIMIT 10
+"""
+_SQL_RECENT_ITEMS = """
+    SELECT title, price, url,
+           strftime('%H:%M:%S', notified_at / 1000000000, 'unixepoch', 'localtime')
+    FROM tracked_items
+    ORDER BY id DESC
+    LIMIT 20
+"""
+
+def _dashboard_stats() -> tuple:
+    """Run the three dashboard queries on a pooled read connection"""
+    with read_conn() as conn:
+        cursor = conn.cursor()
+
+        # One pass over tracked_items instead of three separate COUNTs
+        cursor.execute(_SQL_DASHBOARD_COUNTS)
+        total_items, passed_title, passed_desc = cursor.fetchone()
+
+        # total_found is kept current by the cycle flush, so the per-product
+        # counts come straight off search_queries — no join/group over the
+        # ever-growing tracked_items table
+        cursor.execute(_SQL_TOP_PRODUCTS)
+        top_products = cursor.fetchall()
+
+        cursor.execute(_SQL_RECENT_ITEMS)
+        recent_items = cursor.fetchall()
+
+    return total_items, passed_title, passed_desc, top_products, recent_items
+
+@app.get("/api/dashboard")
+async def api_dashboard():
+    """Dashboard numbers as JSON, for scripts and external monitors"""
+    total_items, passed_title, passed_desc, top_products, recent_items = \
+        await asyncio.to_thread(_dashboard_stats)
+    return {
+        "total_items": total_items,
+        "passed_title_filter": passed_title,
+        "passed_desc_filter": passed_desc,
+        "top_products": [{"name": name, "count": count} for name, count in top_products],
+        "recent_items": [
+            {"title": title, "price": price, "url": url, "time": notified_time}
+            for title, price, url, notified_time in recent_items
+        ],
+    }
+
+def _build_dashboard() -> bytes:
+    """Query stats and render the dashboard, refreshing the cache"""
+    total_items, passed_title, passed_desc, top_products, recent_items = _dashboard_stats()
+
+    # If nothing changed since the last render, the cached bytes are still
+    # right — just extend their TTL instead of re-rendering
+    signature = (total_items, passed_title, passed_desc,
+                 tuple(top_products), tuple(recent_items))
+    if signature == _dashboard_cache['sig'] and _dashboard_cache['html'] is not None:
+        _dashboard_cache['at'] = time.monotonic()
+        return _dashboard_cache['html']
+
+    # Times arrive pre-formatted by SQLite's strftime; the rest is the
+    # template's job
+    recent = [{
+        'title': title,
+        'price': price,
+        'url': url,
+        'time': notified_time,
+    } for title, price, url, notified_time in recent_items]
+
+    html = DASHBOARD_TEMPLATE.render(
+        total_items=total_items,
+        passed_title=passed_title,
+        passed_desc=passed_desc,
+        top_products=top_products,
+        recent_items=recent,
+    )
+    rendered = html.encode('utf-8')
+    _dashboard_cache['html'] = rendered
+    _dashboard_cache['at'] = time.monotonic()
+    _dashboard_cache['sig'] = signature
+    _dashboard_cache['etag'] = '"%s"' % hashlib.blake2b(rendered, digest_size=8).hexdigest()
+    _dashboard_cache['modified'] = formatdate(usegmt=True)
+    return rendered
+
+# Static portion of the health payload, assembled once at import; only the
+# timestamp varies per request
+_HEALTH_BASE = {
+    "status": "healthy",
+    "bot": "dji_drones",
+    "products_tracked": len(PRODUCT_SPECS),
+    "scan_interval": CYCLE_INTERVAL,
+    "description_scraping": True,
+}
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "bot": "dji_drones",
-        "products_tracked": len(PRODUCT_SPECS),
-        "scan_interval": CYCLE_INTERVAL,
-        "description_scraping": True,
-        "timestamp": datetime.now().isoformat()
-    }
+    # orjson serializes datetime natively (RFC 3339), no .isoformat() needed
+    return {**_HEALTH_BASE, "timestamp": datetime.now(timezone.utc)}
+
+@app.post("/trigger")
+async def trigger_cycle():
+    """Start the next scan cycle without waiting out the interval"""
+    CYCLE_TRIGGER.set()
+    return {"status": "triggered"}
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
-    logger.info(f"🚀 Starting server on port {port}")
-    uvicorn.run("main:app", host="0.0.0.0", port=port, log_level="info")
+    logger.info("🚀 Starting server on port %s", port)
+    # uvloop + httptools (both in uvicorn[standard]) over the pure-Python
+    # loop/h11 stack; access logging off — request logs add a write per hit
+    # and the bot's own logging already covers what matters
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools",
+        access_log=False,
+        # Serving can scale past the GIL via WEB_CONCURRENCY, but every worker
+        # runs its own scheduler and SQLite writer, so >1 means duplicate scan
+        # cycles (and duplicate Discord pings) until the scheduler is made
+        # single-elect. Default stays at one process.
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )